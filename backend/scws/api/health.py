@@ -2,40 +2,113 @@
 Health check and metrics endpoints
 """
 
+import asyncio
 import time
-from datetime import datetime
+from dataclasses import dataclass
+from typing import Optional
 
 import psutil
 from fastapi import APIRouter
 
 from scws.core.adb import device_manager
 from scws.models import HealthCheckResponse, MetricsResponse, MemoryUsage, ServiceStatus
+from scws.utils import get_logger, now_iso
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
 # Track startup time
 startup_time = time.time()
 
+# Interval between system metric samples (seconds)
+METRICS_SAMPLE_INTERVAL = 2.0
+
+
+@dataclass(slots=True)
+class SystemSnapshot:
+    """Last sampled system metrics"""
+
+    cpu_usage: float = 0.0
+    memory_used: int = 0
+    memory_total: int = 0
+    memory_percentage: float = 0.0
+
+
+class _MetricsSampler:
+    """Sample system metrics in the background so requests never block on psutil"""
+
+    def __init__(self, interval: float = METRICS_SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.snapshot = SystemSnapshot()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @staticmethod
+    def _sample_sync() -> SystemSnapshot:
+        """Take a single sample (runs in the default executor)"""
+        memory = psutil.virtual_memory()
+        return SystemSnapshot(
+            cpu_usage=psutil.cpu_percent(interval=None),
+            memory_used=memory.used,
+            memory_total=memory.total,
+            memory_percentage=memory.percent,
+        )
+
+    async def _sample_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                self.snapshot = await loop.run_in_executor(None, self._sample_sync)
+            except Exception as e:
+                logger.error("Error sampling system metrics", error=str(e))
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the sampling task"""
+        if self._task:
+            return
+
+        # Prime cpu_percent so the first non-blocking reading is meaningful
+        psutil.cpu_percent(interval=None)
+        self._task = asyncio.create_task(self._sample_loop())
+
+    async def stop(self) -> None:
+        """Stop the sampling task"""
+        if not self._task:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+metrics_sampler = _MetricsSampler()
+
+# Service status only takes two shapes, so build them once
+_SERVICE_STATUS = {
+    "connected": ServiceStatus(adb="connected", redis=None),
+    "disconnected": ServiceStatus(adb="disconnected", redis=None),
+}
+
 
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check() -> HealthCheckResponse:
     """Health check endpoint"""
     uptime = time.time() - startup_time
 
-    # Check ADB daemon connection
-    try:
-        devices = await device_manager.list_devices()
-        adb_status = "connected"
-    except Exception:
-        adb_status = "disconnected"
+    # ADB status is maintained by the device manager's polling loop
+    adb_status = device_manager.adb_status
 
     status = "healthy" if adb_status == "connected" else "unhealthy"
 
     return HealthCheckResponse(
         status=status,
         uptime=uptime,
-        timestamp=datetime.now().isoformat(),
-        services=ServiceStatus(adb=adb_status),  # type: ignore
+        timestamp=now_iso(),
+        services=_SERVICE_STATUS[adb_status],
     )
 
 
@@ -44,19 +117,18 @@ async def get_metrics() -> MetricsResponse:
     """Get application metrics"""
     devices = await device_manager.list_devices()
 
-    # Get system metrics
-    cpu_usage = psutil.cpu_percent(interval=0.1)
-    memory = psutil.virtual_memory()
+    # Read the last sampled system metrics
+    snapshot = metrics_sampler.snapshot
 
     return MetricsResponse(
         active_devices=len(devices),
         active_streams=0,  # TODO: Implement stream tracking
         total_connections=0,  # TODO: Implement connection tracking
-        cpu_usage=cpu_usage,
+        cpu_usage=snapshot.cpu_usage,
         memory_usage=MemoryUsage(
-            used=memory.used,
-            total=memory.total,
-            percentage=memory.percent,
+            used=snapshot.memory_used,
+            total=snapshot.memory_total,
+            percentage=snapshot.memory_percentage,
         ),
-        timestamp=datetime.now().isoformat(),
+        timestamp=now_iso(),
     )
@@ -2,6 +2,8 @@
 Streaming control endpoints
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 
 from scws.core.adb import device_manager
@@ -11,9 +13,39 @@ from scws.utils import AppError
 
 router = APIRouter()
 
+
+class StreamRegistry:
+    """Track active streaming sessions by device serial"""
+
+    __slots__ = ("_map",)
+
+    def __init__(self) -> None:
+        self._map: dict[str, ScrcpyProcessManager] = {}
+
+    def get(self, serial: str) -> Optional[ScrcpyProcessManager]:
+        """Get process manager for a device, if any"""
+        return self._map.get(serial)
+
+    def get_or_404(self, serial: str) -> ScrcpyProcessManager:
+        """Get process manager for a device or raise a 404"""
+        process_manager = self._map.get(serial)
+        if process_manager is None:
+            raise HTTPException(
+                status_code=404, detail={"error": f"Stream not found for device: {serial}"}
+            )
+        return process_manager
+
+    def register(self, serial: str, process_manager: ScrcpyProcessManager) -> None:
+        """Register (or replace) the process manager for a device"""
+        self._map[serial] = process_manager
+
+    def drop(self, serial: str) -> None:
+        """Forget the process manager for a device"""
+        self._map.pop(serial, None)
+
+
 # Track active streaming sessions
-# In production, this would be a proper service/manager
-active_streams: dict[str, ScrcpyProcessManager] = {}
+active_streams = StreamRegistry()
 
 
 @router.post("/{serial}/stream/start", response_model=ScrcpyServerStatus)
@@ -26,7 +58,8 @@ async def start_stream(serial: str, config: ScrcpyConfig | None = None) -> Scrcp
             connection = await device_manager.connect_to_device(serial)
 
         # Check if stream already active
-        if serial in active_streams and active_streams[serial].is_running():
+        existing = active_streams.get(serial)
+        if existing is not None and existing.is_running():
             raise HTTPException(
                 status_code=409,
                 detail={"error": f"Stream already active for device: {serial}"},
@@ -39,10 +72,12 @@ async def start_stream(serial: str, config: ScrcpyConfig | None = None) -> Scrcp
         # Start streaming
         await process_manager.start()
 
-        active_streams[serial] = process_manager
+        active_streams.register(serial, process_manager)
 
         return process_manager.get_status()
 
+    except HTTPException:
+        raise
     except AppError as e:
         raise HTTPException(status_code=e.status_code, detail=e.to_dict())
     except Exception as e:
@@ -53,17 +88,15 @@ async def start_stream(serial: str, config: ScrcpyConfig | None = None) -> Scrcp
 async def stop_stream(serial: str) -> dict[str, str]:
     """Stop streaming for a device"""
     try:
-        process_manager = active_streams.get(serial)
-        if not process_manager:
-            raise HTTPException(
-                status_code=404, detail={"error": f"Stream not found for device: {serial}"}
-            )
+        process_manager = active_streams.get_or_404(serial)
 
         await process_manager.stop()
-        del active_streams[serial]
+        active_streams.drop(serial)
 
         return {"message": f"Stream stopped for device {serial}"}
 
+    except HTTPException:
+        raise
     except AppError as e:
         raise HTTPException(status_code=e.status_code, detail=e.to_dict())
     except Exception as e:
@@ -73,13 +106,7 @@ async def stop_stream(serial: str) -> dict[str, str]:
 @router.get("/{serial}/stream/status", response_model=ScrcpyServerStatus)
 async def get_stream_status(serial: str) -> ScrcpyServerStatus:
     """Get stream status for a device"""
-    process_manager = active_streams.get(serial)
-    if not process_manager:
-        raise HTTPException(
-            status_code=404, detail={"error": f"Stream not found for device: {serial}"}
-        )
-
-    return process_manager.get_status()
+    return active_streams.get_or_404(serial).get_status()
 
 
 @router.patch("/{serial}/stream/config")
@@ -88,16 +115,14 @@ async def update_stream_config(
 ) -> dict[str, str]:
     """Update stream configuration (requires restart)"""
     try:
-        process_manager = active_streams.get(serial)
-        if not process_manager:
-            raise HTTPException(
-                status_code=404, detail={"error": f"Stream not found for device: {serial}"}
-            )
+        process_manager = active_streams.get_or_404(serial)
 
         # Update configuration
+        # model_copy does not re-validate; the delta is already validated and
+        # carries the same field types as ScrcpyConfig
         current_config = process_manager.config
         updated_config = current_config.model_copy(
-            update=config_update.model_dump(exclude_unset=True)
+            update=config_update.model_dump(exclude_unset=True, exclude_none=True)
         )
 
         # Create new process manager with updated config
@@ -108,10 +133,12 @@ async def update_stream_config(
         await process_manager.stop()
         await new_process_manager.start()
 
-        active_streams[serial] = new_process_manager
+        active_streams.register(serial, new_process_manager)
 
         return {"message": "Stream configuration updated and restarted"}
 
+    except HTTPException:
+        raise
     except AppError as e:
         raise HTTPException(status_code=e.status_code, detail=e.to_dict())
     except Exception as e:
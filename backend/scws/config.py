@@ -2,6 +2,7 @@
 Application configuration using Pydantic Settings
 """
 
+import sys
 from functools import lru_cache
 from typing import Literal
 
@@ -24,6 +25,11 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=9001)
     reload: bool = Field(default=False)
+    # uvloop is not available on Windows; "auto" falls back to asyncio there
+    server_loop: Literal["auto", "asyncio", "uvloop"] = Field(
+        default="auto" if sys.platform == "win32" else "uvloop"
+    )
+    server_http: Literal["auto", "h11", "httptools"] = Field(default="httptools")
 
     # ADB Configuration
     adb_host: str = Field(default="127.0.0.1")
@@ -39,6 +45,8 @@ class Settings(BaseSettings):
     # WebSocket Configuration
     ws_max_connections: int = Field(default=100)
     ws_heartbeat_interval: int = Field(default=30)
+    # Messages queued per client before a slow client is dropped
+    ws_outbound_buffer: int = Field(default=64, ge=1)
 
     # Redis Configuration
     redis_host: str = Field(default="localhost")
@@ -2,7 +2,7 @@
 ADB connection and device management
 """
 
-from .connection import ADBConnection
+from .connection import ADBConnection, load_rsa_keys
 from .device_manager import ADBDeviceManager, device_manager
 
-__all__ = ["ADBConnection", "ADBDeviceManager", "device_manager"]
+__all__ = ["ADBConnection", "ADBDeviceManager", "device_manager", "load_rsa_keys"]
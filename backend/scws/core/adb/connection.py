@@ -3,8 +3,11 @@ ADB Connection wrapper using adb-shell
 """
 
 import asyncio
+import os
+import re
+import time
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from adb_shell.adb_device_async import AdbDeviceTcpAsync
 from adb_shell.auth.sign_pythonrsa import PythonRSASigner
@@ -14,18 +17,61 @@ from scws.utils import ADBDeviceOfflineError, get_logger
 
 logger = get_logger(__name__)
 
+# Device info is fetched in one shell round-trip, sections separated by a marker line
+_DEVICE_INFO_SEPARATOR = "---\n"
+_DEVICE_INFO_COMMAND = (
+    "getprop ro.product.model; echo ---; "
+    "getprop ro.product.manufacturer; echo ---; "
+    "getprop ro.build.version.release; echo ---; "
+    "wm size"
+)
+_WM_SIZE_RE = re.compile(r"Physical size:\s*(\d+)x(\d+)")
+
+# Default ADB private key location
+ADB_KEY_PATH = "~/.android/adbkey"
+
+
+def load_rsa_keys(key_path: str = ADB_KEY_PATH) -> List[PythonRSASigner]:
+    """Load ADB RSA signers, returning an empty list if no usable key exists"""
+    try:
+        path = os.path.expanduser(key_path)
+        if os.path.exists(path):
+            return [PythonRSASigner.FromRSAKeyPath(path)]
+    except Exception as e:
+        logger.warning("Failed to load ADB key", key_path=key_path, error=str(e))
+    return []
+
 
 class ADBConnection:
     """ADB connection wrapper for a single device"""
 
-    def __init__(self, serial: str, host: str = "127.0.0.1", port: int = 5037) -> None:
+    __slots__ = (
+        "serial",
+        "host",
+        "port",
+        "_rsa_keys",
+        "_device",
+        "_connected",
+        "_connection_time",
+        "_last_activity",
+    )
+
+    def __init__(
+        self,
+        serial: str,
+        host: str = "127.0.0.1",
+        port: int = 5037,
+        rsa_keys: Optional[List[PythonRSASigner]] = None,
+    ) -> None:
         self.serial = serial
         self.host = host
         self.port = self._parse_port_from_serial(serial, port)
+        self._rsa_keys = rsa_keys if rsa_keys is not None else []
         self._device: Optional[AdbDeviceTcpAsync] = None
         self._connected = False
         self._connection_time: Optional[datetime] = None
-        self._last_activity: Optional[datetime] = None
+        # Monotonic clock reading; converted to a datetime only when read
+        self._last_activity: Optional[float] = None
 
     @staticmethod
     def _parse_port_from_serial(serial: str, default_port: int) -> int:
@@ -50,7 +96,9 @@ class ADBConnection:
     @property
     def last_activity(self) -> Optional[datetime]:
         """Get last activity timestamp"""
-        return self._last_activity
+        if self._last_activity is None:
+            return None
+        return datetime.fromtimestamp(time.time() - (time.monotonic() - self._last_activity))
 
     async def connect(self) -> None:
         """Connect to the device"""
@@ -60,22 +108,11 @@ class ADBConnection:
             # Create ADB device instance
             self._device = AdbDeviceTcpAsync(host=self.host, port=self.port, default_timeout_s=10)
 
-            # Try to connect with RSA keys if available
-            rsa_keys = []
-            try:
-                import os
-                key_path = os.path.expanduser("~/.android/adbkey")
-                if os.path.exists(key_path):
-                    signer = PythonRSASigner.FromRSAKeyPath(key_path)
-                    rsa_keys = [signer]
-            except Exception:
-                pass  # Continue without keys
-
-            await self._device.connect(rsa_keys=rsa_keys, auth_timeout_s=10)
+            await self._device.connect(rsa_keys=self._rsa_keys, auth_timeout_s=10)
 
             self._connected = True
             self._connection_time = datetime.now()
-            self._last_activity = datetime.now()
+            self._last_activity = time.monotonic()
 
             logger.info("Device connected successfully", serial=self.serial)
         except Exception as e:
@@ -101,13 +138,14 @@ class ADBConnection:
 
     async def shell(self, command: str) -> str:
         """Execute shell command on device"""
-        if not self.is_connected or not self._device:
+        device = self._device
+        if not self._connected or device is None:
             raise ADBDeviceOfflineError(self.serial)
 
-        self._last_activity = datetime.now()
+        self._last_activity = time.monotonic()
 
         try:
-            result = await self._device.shell(command)
+            result = await device.shell(command)
             return result
         except Exception as e:
             logger.error(
@@ -115,52 +153,54 @@ class ADBConnection:
             )
             raise
 
-    async def push(self, local_path: str, device_path: str) -> None:
-        """Push file to device"""
-        if not self.is_connected or not self._device:
+    async def push(self, local_path: str, device_path: str, st_mode: Optional[int] = None) -> None:
+        """Push file to device, optionally setting its file mode"""
+        device = self._device
+        if not self._connected or device is None:
             raise ADBDeviceOfflineError(self.serial)
 
-        self._last_activity = datetime.now()
+        self._last_activity = time.monotonic()
 
         try:
-            with open(local_path, "rb") as f:
-                data = f.read()
-                await self._device.push(data, device_path)
+            # adb-shell streams the file from disk in sync-protocol sized chunks
+            if st_mode is None:
+                await device.push(local_path, device_path)
+            else:
+                await device.push(local_path, device_path, st_mode=st_mode)
         except Exception as e:
             logger.error("Push failed", serial=self.serial, error=str(e))
             raise
 
     async def pull(self, device_path: str, local_path: str) -> None:
         """Pull file from device"""
-        if not self.is_connected or not self._device:
+        device = self._device
+        if not self._connected or device is None:
             raise ADBDeviceOfflineError(self.serial)
 
-        self._last_activity = datetime.now()
+        self._last_activity = time.monotonic()
 
         try:
-            data = await self._device.pull(device_path)
-            with open(local_path, "wb") as f:
-                f.write(data)
+            # adb-shell writes each received chunk straight to disk
+            await device.pull(device_path, local_path)
         except Exception as e:
             logger.error("Pull failed", serial=self.serial, error=str(e))
             raise
 
     async def get_device_info(self) -> ADBDevice:
         """Get device information"""
-        model = (await self.shell("getprop ro.product.model")).strip()
-        manufacturer = (await self.shell("getprop ro.product.manufacturer")).strip()
-        android_version = (await self.shell("getprop ro.build.version.release")).strip()
+        output = await self.shell(_DEVICE_INFO_COMMAND)
+        sections = output.replace("\r\n", "\n").split(_DEVICE_INFO_SEPARATOR)
+        sections += [""] * (4 - len(sections))
+
+        model = sections[0].rstrip("\n")
+        manufacturer = sections[1].rstrip("\n")
+        android_version = sections[2].rstrip("\n")
 
         # Get screen resolution
-        wm_size = await self.shell("wm size")
         resolution: Optional[Resolution] = None
-        if "Physical size:" in wm_size:
-            try:
-                size_str = wm_size.split("Physical size:")[1].strip()
-                width, height = size_str.split("x")
-                resolution = Resolution(width=int(width), height=int(height))
-            except (IndexError, ValueError):
-                pass
+        match = _WM_SIZE_RE.search(sections[3])
+        if match:
+            resolution = Resolution(width=int(match.group(1)), height=int(match.group(2)))
 
         return ADBDevice(
             id=self.serial,
@@ -168,7 +208,9 @@ class ADBConnection:
             model=model,
             state=DeviceState.DEVICE,
             transport_type="wifi" if ":" in self.serial else "usb",
-            connection_time=self._connection_time or datetime.now(),
+            connection_time=(
+                self._connection_time if self._connection_time is not None else datetime.now()
+            ),
             manufacturer=manufacturer,
             android_version=android_version,
             resolution=resolution,
@@ -181,7 +223,7 @@ class ADBConnection:
                 return False
 
             await self.shell("echo ping")
-            self._last_activity = datetime.now()
+            self._last_activity = time.monotonic()
             return True
         except Exception:
             return False
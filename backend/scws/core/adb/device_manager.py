@@ -4,31 +4,76 @@ Manages device discovery, connection pooling, and lifecycle
 """
 
 import asyncio
-from typing import Dict, List, Optional
+import heapq
+import time
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+
+from adb_shell.auth.sign_pythonrsa import PythonRSASigner
 
 from scws.config import settings
 from scws.models import ADBDevice
 from scws.utils import ADBConnectionError, ADBDeviceNotFoundError, get_logger
 
-from .connection import ADBConnection
+from .connection import ADBConnection, load_rsa_keys
 
 logger = get_logger(__name__)
 
+# Interval between health checks of a single connection (seconds)
+HEALTH_CHECK_INTERVAL = 2.0
+
+# Maximum number of devices disconnected concurrently during shutdown
+SHUTDOWN_CONCURRENCY = 16
+
 
 class ADBDeviceManager:
     """Manages ADB device connections"""
 
+    __slots__ = (
+        "_connections",
+        "_conn_snapshot",
+        "_devices",
+        "_rsa_keys",
+        "_polling_task",
+        "_adb_status",
+        "_last_poll_ok",
+        "_check_heap",
+        "_next_check",
+        "_has_connections",
+    )
+
     def __init__(self) -> None:
         self._connections: Dict[str, ADBConnection] = {}
+        # Immutable copy of _connections for lock-free iteration by readers
+        self._conn_snapshot: Tuple[Tuple[str, ADBConnection], ...] = ()
         self._devices: Dict[str, ADBDevice] = {}
+        self._rsa_keys: List[PythonRSASigner] = []
         self._polling_task: Optional[asyncio.Task[None]] = None
-        self._running = False
+        self._adb_status: Literal["connected", "disconnected"] = "disconnected"
+        self._last_poll_ok: float = 0.0
+        # Min-heap of (due time, serial); entries not matching _next_check are stale
+        self._check_heap: List[Tuple[float, str]] = []
+        self._next_check: Dict[str, float] = {}
+        # Created by _start_polling so it binds to the running event loop
+        self._has_connections: Optional[asyncio.Event] = None
+
+    @property
+    def adb_status(self) -> Literal["connected", "disconnected"]:
+        """Get ADB status from the last poll"""
+        return self._adb_status
+
+    @property
+    def last_poll_ok(self) -> float:
+        """Get monotonic time of the last successful poll"""
+        return self._last_poll_ok
 
     async def initialize(self) -> None:
         """Initialize the device manager"""
         try:
             logger.info("Initializing ADB device manager")
 
+            # Parse the ADB key once; every connection reuses the signer
+            self._rsa_keys = load_rsa_keys()
+
             # Start device polling
             await self.poll_devices()
             self._start_polling()
@@ -42,8 +87,6 @@ class ADBDeviceManager:
         """Shutdown the device manager"""
         logger.info("Shutting down device manager")
 
-        self._running = False
-
         # Cancel polling task
         if self._polling_task:
             self._polling_task.cancel()
@@ -51,13 +94,28 @@ class ADBDeviceManager:
                 await self._polling_task
             except asyncio.CancelledError:
                 pass
+            self._polling_task = None
+
+        # Disconnect all devices, bounding concurrent socket teardown
+        sem = asyncio.Semaphore(SHUTDOWN_CONCURRENCY)
+
+        async def disconnect(serial: str, conn: ADBConnection) -> None:
+            async with sem:
+                try:
+                    await conn.disconnect()
+                except Exception as e:
+                    logger.error("Error disconnecting device", serial=serial, error=str(e))
 
-        # Disconnect all devices
-        disconnect_tasks = [conn.disconnect() for conn in self._connections.values()]
-        await asyncio.gather(*disconnect_tasks, return_exceptions=True)
+        async with asyncio.TaskGroup() as tg:
+            for serial, conn in self._conn_snapshot:
+                tg.create_task(disconnect(serial, conn))
 
         self._connections.clear()
         self._devices.clear()
+        self._publish_snapshot()
+        self._check_heap.clear()
+        self._next_check.clear()
+        self._has_connections = None
 
         logger.info("Device manager shut down")
 
@@ -87,7 +145,9 @@ class ADBDeviceManager:
             return existing_connection
 
         # Create new connection
-        connection = ADBConnection(serial, host=settings.adb_host, port=settings.adb_port)
+        connection = ADBConnection(
+            serial, host=settings.adb_host, port=settings.adb_port, rsa_keys=self._rsa_keys
+        )
         await connection.connect()
 
         # Get device info
@@ -96,6 +156,8 @@ class ADBDeviceManager:
         # Store connection and device info
         self._connections[serial] = connection
         self._devices[serial] = device_info
+        self._publish_snapshot()
+        self._schedule_check(serial, time.monotonic())
 
         logger.info("Device connected", serial=serial, model=device_info.model)
 
@@ -108,10 +170,8 @@ class ADBDeviceManager:
         connection = self._connections.get(serial)
         if connection:
             await connection.disconnect()
-            del self._connections[serial]
 
-        if serial in self._devices:
-            del self._devices[serial]
+        self._forget_device(serial)
 
         logger.info("Device disconnected", serial=serial)
 
@@ -124,35 +184,107 @@ class ADBDeviceManager:
             # `adb devices` via subprocess or use adb-shell's device listing
 
             # Health check for existing connections
-            health_tasks = {
-                serial: conn.health_check() for serial, conn in self._connections.items()
-            }
-
-            results = await asyncio.gather(*health_tasks.values(), return_exceptions=True)
-
-            for serial, is_healthy in zip(health_tasks.keys(), results):
-                if isinstance(is_healthy, bool) and not is_healthy:
-                    logger.warning("Device unhealthy, disconnecting", serial=serial)
-                    await self.disconnect_from_device(serial)
+            await self._check_connections(self._conn_snapshot)
 
         except Exception as e:
+            self._adb_status = "disconnected"
             logger.error("Error polling devices", error=str(e))
 
+    async def _check_connections(self, items: Sequence[Tuple[str, ADBConnection]]) -> None:
+        """Health check connections, disconnecting unhealthy ones"""
+        results = await asyncio.gather(
+            *(conn.health_check() for _, conn in items), return_exceptions=True
+        )
+
+        now = time.monotonic()
+        for (serial, conn), is_healthy in zip(items, results):
+            # Skip connections replaced or removed while checking
+            if self._connections.get(serial) is not conn:
+                continue
+
+            if isinstance(is_healthy, bool) and not is_healthy:
+                logger.warning("Device unhealthy, disconnecting", serial=serial)
+                try:
+                    await self.disconnect_from_device(serial)
+                except Exception as e:
+                    # Drop it anyway so a failing close cannot stop the remaining
+                    # checks from being rescheduled
+                    logger.error(
+                        "Error disconnecting unhealthy device", serial=serial, error=str(e)
+                    )
+                    self._forget_device(serial)
+            else:
+                self._schedule_check(serial, now)
+
+        self._adb_status = "connected"
+        self._last_poll_ok = now
+
+    def _schedule_check(self, serial: str, now: float) -> None:
+        """Schedule the next health check for a connection"""
+        due = now + HEALTH_CHECK_INTERVAL
+        self._next_check[serial] = due
+        heapq.heappush(self._check_heap, (due, serial))
+        if self._has_connections is not None:
+            self._has_connections.set()
+
+    def _pop_due_checks(self, now: float) -> List[Tuple[str, ADBConnection]]:
+        """Pop connections whose health check is due, dropping stale entries"""
+        due: List[Tuple[str, ADBConnection]] = []
+        heap = self._check_heap
+        while heap and heap[0][0] <= now:
+            when, serial = heapq.heappop(heap)
+            if self._next_check.get(serial) != when:
+                continue
+            del self._next_check[serial]
+            conn = self._connections.get(serial)
+            if conn is not None:
+                due.append((serial, conn))
+        return due
+
+    def _forget_device(self, serial: str) -> None:
+        """Remove a device's connection, info and pending health check"""
+        if self._connections.pop(serial, None) is not None:
+            self._publish_snapshot()
+        self._devices.pop(serial, None)
+        self._next_check.pop(serial, None)
+
+    def _publish_snapshot(self) -> None:
+        """Publish a new connections snapshot after mutating _connections"""
+        self._conn_snapshot = tuple(self._connections.items())
+
     def _start_polling(self) -> None:
         """Start device polling task"""
         if self._polling_task:
             return
 
-        self._running = True
+        has_connections = asyncio.Event()
+        if self._next_check:
+            has_connections.set()
+        self._has_connections = has_connections
 
         async def poll_loop() -> None:
-            while self._running:
+            while True:
                 try:
-                    await self.poll_devices()
-                    await asyncio.sleep(2)  # Poll every 2 seconds
+                    if not self._next_check:
+                        # Nothing to check; sleep until a device connects
+                        self._check_heap.clear()
+                        has_connections.clear()
+                        await has_connections.wait()
+                        continue
+
+                    # New checks are always scheduled a full interval out, so nothing
+                    # can become due before the current heap head
+                    delay = self._check_heap[0][0] - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                    due = self._pop_due_checks(time.monotonic())
+                    if due:
+                        await self._check_connections(due)
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
+                    self._adb_status = "disconnected"
                     logger.error("Error in polling loop", error=str(e))
                     await asyncio.sleep(5)  # Back off on error
 
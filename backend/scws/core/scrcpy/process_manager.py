@@ -4,9 +4,10 @@ Manages scrcpy-server process lifecycle
 """
 
 import asyncio
-from datetime import datetime
+import time
 from typing import Optional
 
+from scws.config import settings
 from scws.core.adb import ADBConnection
 from scws.models import ScrcpyConfig, ScrcpyServerState, ScrcpyServerStatus
 from scws.utils import ScrcpyStartError, ScrcpyServerCrashError, get_logger
@@ -16,17 +17,32 @@ from .server_deployer import ScrcpyServerDeployer
 
 logger = get_logger(__name__)
 
+# Seconds to wait for scrcpy-server to exit after SIGTERM before killing it
+PROCESS_TERMINATE_TIMEOUT = 2.0
+
 
 class ScrcpyProcessManager:
     """Manage scrcpy-server process lifecycle"""
 
     def __init__(self, connection: ADBConnection, config: ScrcpyConfig) -> None:
         self.connection = connection
+        self._log = logger.bind(serial=connection.serial)
+        self._deployer = ScrcpyServerDeployer(connection)
         self.config = config
         self.state = ScrcpyServerState.STOPPED
-        self.start_time: Optional[datetime] = None
+        # Wall-clock start time in epoch milliseconds
+        self.start_time: Optional[int] = None
         self.error: Optional[str] = None
+        self._proc: Optional[asyncio.subprocess.Process] = None
         self._process_task: Optional[asyncio.Task[None]] = None
+        self._crash_task: Optional[asyncio.Task[None]] = None
+        # Serializes start/stop/restart; the epoch counts completed restarts so
+        # callers queued behind a restart can skip a redundant one
+        self._lifecycle_lock = asyncio.Lock()
+        self._restart_epoch = 0
+        # Last built status; rebuilt only after a state change marks it dirty
+        self._status_cache: Optional[ScrcpyServerStatus] = None
+        self._status_dirty = True
 
     @property
     def serial(self) -> str:
@@ -35,13 +51,18 @@ class ScrcpyProcessManager:
 
     def get_status(self) -> ScrcpyServerStatus:
         """Get current status"""
-        return ScrcpyServerStatus(
+        if not self._status_dirty and self._status_cache is not None:
+            return self._status_cache
+
+        self._status_cache = ScrcpyServerStatus(
             state=self.state,
             device_serial=self.serial,
             config=self.config,
             start_time=self.start_time,
             error=self.error,
         )
+        self._status_dirty = False
+        return self._status_cache
 
     def is_running(self) -> bool:
         """Check if server is running"""
@@ -49,32 +70,61 @@ class ScrcpyProcessManager:
 
     async def start(self) -> None:
         """Start scrcpy server"""
+        async with self._lifecycle_lock:
+            await self._start()
+
+    async def stop(self) -> None:
+        """Stop scrcpy server"""
+        async with self._lifecycle_lock:
+            await self._stop()
+
+    async def restart(self) -> None:
+        """Restart scrcpy server"""
+        epoch = self._restart_epoch
+        async with self._lifecycle_lock:
+            if self._restart_epoch != epoch:
+                self._log.debug("SCRCpy server already restarted by a concurrent call")
+                return
+
+            self._log.info("Restarting scrcpy server")
+            await self._stop()
+            await self._start()
+            self._restart_epoch += 1
+
+    async def _start(self) -> None:
+        """Start scrcpy server (lifecycle lock held)"""
         if self.state == ScrcpyServerState.RUNNING:
-            logger.warning("SCRCpy server already running", serial=self.serial)
+            self._log.warning("SCRCpy server already running")
             return
 
         try:
-            logger.info("Starting scrcpy server", serial=self.serial)
+            self._log.info("Starting scrcpy server")
 
             self.state = ScrcpyServerState.STARTING
             self.error = None
+            self._status_dirty = True
 
             # Deploy server if needed
-            await ScrcpyServerDeployer.deploy(self.connection)
+            await self._deployer.deploy()
 
             # Start server process
             await self._start_process()
 
             self.state = ScrcpyServerState.RUNNING
-            self.start_time = datetime.now()
+            self.start_time = time.time_ns() // 1_000_000
+            self._status_dirty = True
 
-            logger.info("SCRCpy server started successfully", serial=self.serial)
+            self._log.info("SCRCpy server started successfully")
 
         except Exception as e:
             self.state = ScrcpyServerState.ERROR
             self.error = str(e)
+            self._status_dirty = True
+
+            self._log.error("Failed to start scrcpy server", error=str(e))
 
-            logger.error("Failed to start scrcpy server", serial=self.serial, error=str(e))
+            # The device copy may be gone (wiped device, reused emulator serial)
+            self._deployer.invalidate()
 
             await self._cleanup()
 
@@ -82,85 +132,113 @@ class ScrcpyProcessManager:
                 raise
             raise ScrcpyStartError(str(e), details=str(e))
 
-    async def stop(self) -> None:
-        """Stop scrcpy server"""
+    async def _stop(self) -> None:
+        """Stop scrcpy server (lifecycle lock held)"""
         if self.state == ScrcpyServerState.STOPPED:
             return
 
-        logger.info("Stopping scrcpy server", serial=self.serial)
+        self._log.info("Stopping scrcpy server")
 
         self.state = ScrcpyServerState.STOPPING
+        self._status_dirty = True
 
         await self._cleanup()
 
         self.state = ScrcpyServerState.STOPPED
         self.start_time = None
+        self._status_dirty = True
 
-        logger.info("SCRCpy server stopped", serial=self.serial)
-
-    async def restart(self) -> None:
-        """Restart scrcpy server"""
-        logger.info("Restarting scrcpy server", serial=self.serial)
-        await self.stop()
-        await self.start()
+        self._log.info("SCRCpy server stopped")
 
     async def _start_process(self) -> None:
         """Start the scrcpy server process"""
         command = ScrcpyConfigBuilder.build_command(self.config)
 
-        logger.debug("Executing scrcpy command", serial=self.serial, command=command)
+        self._log.debug("Executing scrcpy command", command=command)
 
         try:
-            # In a real implementation, you would:
-            # 1. Execute the shell command in background
-            # 2. Set up socket forwarding for video/audio/control
-            # 3. Monitor the process output
-            #
-            # For now, this is a simplified placeholder
-            # You would use asyncio subprocess or connection.shell with proper handling
-
-            # Start server process in background
-            # This is a simplified version - production would handle streams properly
-            self._process_task = asyncio.create_task(
-                self._run_server_process(command)
+            # Run the server through the adb client so the event loop can wait on
+            # the child process directly instead of polling it
+            self._proc = await asyncio.create_subprocess_exec(
+                "adb",
+                "-H",
+                settings.adb_host,
+                "-P",
+                str(settings.adb_port),
+                "-s",
+                self.serial,
+                "shell",
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
             )
+            self._process_task = asyncio.create_task(self._run_server_process(self._proc))
+            self._process_task.add_done_callback(self._on_process_done)
 
         except Exception as e:
             raise ScrcpyStartError("Failed to start scrcpy process", details=str(e))
 
-    async def _run_server_process(self, command: str) -> None:
-        """Run server process and monitor it"""
-        try:
-            # Execute command
-            # In production, you'd properly handle stdin/stdout/stderr
-            await self.connection.shell(command)
-        except Exception as e:
-            logger.error("SCRCpy server process error", serial=self.serial, error=str(e))
-            await self._handle_crash(e)
+    async def _run_server_process(self, proc: asyncio.subprocess.Process) -> None:
+        """Drain server output and wait for the process to exit"""
+        if proc.stdout is not None:
+            async for line in proc.stdout:
+                self._log.debug("SCRCpy server output", line=line.decode(errors="replace").rstrip())
+
+        returncode = await proc.wait()
+        if returncode != 0:
+            raise ScrcpyServerCrashError(
+                f"SCRCpy server exited with code {returncode}",
+                details={"serial": self.serial, "returncode": returncode},
+            )
 
-    async def _handle_crash(self, error: Exception) -> None:
+    def _on_process_done(self, task: "asyncio.Task[None]") -> None:
+        """Schedule crash handling when the process task fails"""
+        if task.cancelled():
+            return
+
+        # Ignore clean exits and tasks already released by _cleanup
+        error = task.exception()
+        if error is None or task is not self._process_task:
+            return
+
+        self._log.error("SCRCpy server process error", error=str(error))
+        self._crash_task = asyncio.create_task(self._handle_crash(error))
+
+    async def _handle_crash(self, error: BaseException) -> None:
         """Handle server crash"""
-        logger.error("SCRCpy server crashed", serial=self.serial, error=str(error))
+        self._log.error("SCRCpy server crashed", error=str(error))
 
         self.state = ScrcpyServerState.ERROR
         self.error = str(error)
+        self._status_dirty = True
+
+        # Re-probe on the next start in case the deployed server is what failed
+        self._deployer.invalidate()
 
         await self._cleanup()
 
     async def _cleanup(self) -> None:
         """Cleanup resources"""
-        # Cancel process task
-        if self._process_task:
-            self._process_task.cancel()
+        # Cancel process task; its done callback ignores the cancellation
+        task = self._process_task
+        self._process_task = None
+        if task:
+            task.cancel()
+
+        # Terminate the server process if still running
+        proc = self._proc
+        self._proc = None
+        if proc and proc.returncode is None:
+            proc.terminate()
             try:
-                await self._process_task
-            except asyncio.CancelledError:
-                pass
-            self._process_task = None
+                async with asyncio.timeout(PROCESS_TERMINATE_TIMEOUT):
+                    await proc.wait()
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
 
         # In production, you would also:
         # - Close socket connections
         # - Remove port forwards
-        # - Kill the server process if still running
 
-        logger.debug("Cleanup completed", serial=self.serial)
+        self._log.debug("Cleanup completed")
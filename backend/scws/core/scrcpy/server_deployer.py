@@ -3,8 +3,13 @@ SCRCpy server deployer
 Handles deploying scrcpy-server to Android devices
 """
 
+import asyncio
+import hashlib
 import os
-from pathlib import Path
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Literal, Optional, Tuple
 
 from scws.core.adb import ADBConnection
 from scws.utils import ScrcpyDeployError, get_logger
@@ -13,97 +18,139 @@ from .config_builder import ScrcpyConfigBuilder
 
 logger = get_logger(__name__)
 
+_SHA256_RE = re.compile(r"[0-9a-f]{64}")
+
+
+@lru_cache(maxsize=8)
+def _file_sha256(path: str, mtime: float, size: int) -> str:
+    """Hash a local file; mtime and size key the cache so edits are picked up"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class ScrcpyServerDeployer:
     """Deploy scrcpy-server to Android devices"""
 
     SERVER_REMOTE_PATH = "/data/local/tmp/scrcpy-server.jar"
-
-    @classmethod
-    async def deploy(cls, connection: ADBConnection) -> None:
+    # Regular file, rw-r--r--; applied by the push itself so no chmod is needed
+    SERVER_REMOTE_MODE = 0o100644
+
+    # Fixed shell commands, built once at class definition. The probe prints the
+    # deployed file's sha256, or falls back to a JAR check on devices without
+    # sha256sum (and to a plain existence check without `file`).
+    _CMD_PROBE = (
+        f"if [ ! -f {SERVER_REMOTE_PATH} ]; then echo missing; "
+        f"elif command -v sha256sum >/dev/null 2>&1; "
+        f"then sha256sum {SERVER_REMOTE_PATH} | cut -c-64; "
+        f"elif ! command -v file >/dev/null 2>&1 "
+        f"|| file {SERVER_REMOTE_PATH} | grep -q 'Java'; then echo ok; "
+        f"else echo bad; fi"
+    )
+    _CMD_RM = f"rm -f {SERVER_REMOTE_PATH}"
+
+    # (connection time, local server mtime, size) last deployed to each device
+    # serial; shared across instances so a new stream on the same device skips
+    # the probe. A reconnect (possibly a different device) misses the cache.
+    _deployed_cache: Dict[str, Tuple[Optional[datetime], float, int]] = {}
+
+    def __init__(self, connection: ADBConnection) -> None:
+        self.connection = connection
+        self._log = logger.bind(serial=connection.serial)
+
+    async def deploy(self) -> None:
         """Deploy scrcpy-server to device"""
-        serial = connection.serial
+        serial = self.connection.serial
 
         try:
-            logger.info("Deploying scrcpy-server to device", serial=serial)
+            self._log.info("Deploying scrcpy-server to device")
 
             server_path = ScrcpyConfigBuilder.get_server_path()
 
             # Check if server file exists locally
-            if not os.path.exists(server_path):
+            try:
+                stat = os.stat(server_path)
+            except OSError:
                 raise ScrcpyDeployError(
                     f"SCRCpy server file not found at {server_path}. "
                     "Please ensure scrcpy-server.jar is available."
-                )
+                ) from None
+            local_version = (self.connection.connection_time, stat.st_mtime, stat.st_size)
 
-            # Check if server is already deployed
-            is_deployed = await cls._is_server_deployed(connection)
-            if is_deployed:
-                logger.info("SCRCpy server already deployed", serial=serial)
+            # Skip device round-trips if this exact file was already deployed
+            if self._deployed_cache.get(serial) == local_version:
+                self._log.debug("SCRCpy server deployment cached")
+                return
+
+            # Check if the same server file is already deployed
+            local_sha = await asyncio.to_thread(
+                _file_sha256, server_path, stat.st_mtime, stat.st_size
+            )
+            probe = await self._probe(local_sha)
+            if probe == "ok":
+                self._log.info("SCRCpy server already deployed")
+                self._deployed_cache[serial] = local_version
                 return
 
             # Push server to device
-            await cls._push_server(connection, server_path)
+            await self._push_server(server_path)
 
             # Verify deployment
-            verified = await cls._verify_deployment(connection)
-            if not verified:
+            if await self._probe(local_sha) != "ok":
                 raise ScrcpyDeployError("Failed to verify scrcpy-server deployment")
 
-            logger.info("SCRCpy server deployed successfully", serial=serial)
+            self._deployed_cache[serial] = local_version
+            self._log.info("SCRCpy server deployed successfully")
 
         except Exception as e:
-            logger.error("Failed to deploy scrcpy-server", serial=serial, error=str(e))
+            self._deployed_cache.pop(serial, None)
+            self._log.error("Failed to deploy scrcpy-server", error=str(e))
             if isinstance(e, ScrcpyDeployError):
                 raise
             raise ScrcpyDeployError("Failed to deploy scrcpy-server", details=str(e))
 
-    @classmethod
-    async def _is_server_deployed(cls, connection: ADBConnection) -> bool:
-        """Check if server is already deployed"""
+    async def _probe(self, local_sha: str) -> Literal["ok", "missing", "bad"]:
+        """Check whether the deployed server matches the local file in one shell call"""
         try:
-            result = await connection.shell(f"test -f {cls.SERVER_REMOTE_PATH} && echo exists")
-            return result.strip() == "exists"
+            result = (await self.connection.shell(self._CMD_PROBE)).strip()
         except Exception:
-            return False
-
-    @classmethod
-    async def _push_server(cls, connection: ADBConnection, local_path: str) -> None:
+            return "missing"
+        if _SHA256_RE.fullmatch(result):
+            return "ok" if result == local_sha else "bad"
+        if result == "ok":
+            return "ok"
+        if result == "bad":
+            return "bad"
+        return "missing"
+
+    async def _push_server(self, local_path: str) -> None:
         """Push server to device"""
         try:
-            logger.debug("Pushing server file", serial=connection.serial, local_path=local_path)
-            await connection.push(local_path, cls.SERVER_REMOTE_PATH)
-            await connection.shell(f"chmod 644 {cls.SERVER_REMOTE_PATH}")
-            logger.debug("Server file pushed successfully", serial=connection.serial)
+            self._log.debug("Pushing server file", local_path=local_path)
+            await self.connection.push(
+                local_path, self.SERVER_REMOTE_PATH, st_mode=self.SERVER_REMOTE_MODE
+            )
+            self._log.debug("Server file pushed successfully")
         except Exception as e:
             raise ScrcpyDeployError("Failed to push server file", details=str(e))
 
-    @classmethod
-    async def _verify_deployment(cls, connection: ADBConnection) -> bool:
-        """Verify server deployment"""
-        try:
-            # Check file exists and is a valid JAR
-            result = await connection.shell(
-                f"file {cls.SERVER_REMOTE_PATH} | grep -q 'Java' && echo valid"
-            )
-            return result.strip() == "valid"
-        except Exception:
-            # If file command not available, just check existence
-            return await cls._is_server_deployed(connection)
-
-    @classmethod
-    async def remove(cls, connection: ADBConnection) -> None:
+    async def remove(self) -> None:
         """Remove server from device"""
         try:
-            logger.info("Removing scrcpy-server from device", serial=connection.serial)
-            await connection.shell(f"rm -f {cls.SERVER_REMOTE_PATH}")
-            logger.info("SCRCpy server removed", serial=connection.serial)
+            self._log.info("Removing scrcpy-server from device")
+            self._deployed_cache.pop(self.connection.serial, None)
+            await self.connection.shell(self._CMD_RM)
+            self._log.info("SCRCpy server removed")
         except Exception as e:
-            logger.error(
-                "Failed to remove scrcpy-server", serial=connection.serial, error=str(e)
-            )
+            self._log.error("Failed to remove scrcpy-server", error=str(e))
             raise
 
+    def invalidate(self) -> None:
+        """Forget that this device has the server, forcing a probe on next deploy"""
+        self._deployed_cache.pop(self.connection.serial, None)
+
     @classmethod
     def get_remote_path(cls) -> str:
         """Get remote server path"""
@@ -13,7 +13,7 @@ from fastapi.responses import ORJSONResponse
 from scws.api import devices, streaming, health
 from scws.config import settings
 from scws.core.adb import device_manager
-from scws.utils import setup_logging, logger
+from scws.utils import logger, setup_logging, shutdown_logging
 from scws.ws import websocket_router
 
 
@@ -24,15 +24,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     setup_logging()
     logger.info("Starting SCWS application", env=settings.env)
 
+    # Shared clients live on app.state so handlers never create their own
+    app.state.device_manager = device_manager
+
     try:
         await device_manager.initialize()
+        health.metrics_sampler.start()
         logger.info("Application started successfully")
         yield
     finally:
         # Shutdown
         logger.info("Shutting down SCWS application")
+        await health.metrics_sampler.stop()
         await device_manager.shutdown()
         logger.info("Application shutdown complete")
+        shutdown_logging()
 
 
 # Create FastAPI application
@@ -75,6 +81,10 @@ def main() -> None:
         host=settings.host,
         port=settings.port,
         reload=settings.reload and settings.is_development,
+        loop=settings.server_loop,
+        http=settings.server_http,
+        ws="websockets",
+        lifespan="on",
         log_config=None,  # Use our custom logging
     )
 
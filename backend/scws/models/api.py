@@ -6,6 +6,8 @@ from typing import Any, Generic, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
+from .scrcpy import AudioCodec, VideoCodec
+
 T = TypeVar("T")
 
 
@@ -89,6 +91,6 @@ class StreamConfigUpdate(BaseModel):
     max_size: Optional[int] = Field(None, description="Maximum video dimension")
     bit_rate: Optional[int] = Field(None, description="Video bitrate")
     max_fps: Optional[int] = Field(None, description="Maximum frame rate")
-    audio_codec: Optional[Literal["aac", "opus"]] = Field(None, description="Audio codec")
+    audio_codec: Optional[AudioCodec] = Field(None, description="Audio codec")
     audio_bit_rate: Optional[int] = Field(None, description="Audio bitrate")
-    video_codec: Optional[Literal["h264", "h265"]] = Field(None, description="Video codec")
+    video_codec: Optional[VideoCodec] = Field(None, description="Video codec")
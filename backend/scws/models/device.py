@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DeviceState(str, Enum):
@@ -27,6 +27,8 @@ class TransportType(str, Enum):
 class Resolution(BaseModel):
     """Screen resolution"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     width: int = Field(..., description="Screen width in pixels")
     height: int = Field(..., description="Screen height in pixels")
 
@@ -44,8 +46,10 @@ class ADBDevice(BaseModel):
     android_version: Optional[str] = Field(None, description="Android version")
     resolution: Optional[Resolution] = Field(None, description="Screen resolution")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "emulator-5554",
                 "serial": "emulator-5554",
@@ -57,7 +61,8 @@ class ADBDevice(BaseModel):
                 "android_version": "13",
                 "resolution": {"width": 1080, "height": 1920},
             }
-        }
+        },
+    )
 
 
 class DeviceConnectionOptions(BaseModel):
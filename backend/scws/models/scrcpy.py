@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class VideoCodec(str, Enum):
@@ -41,8 +41,10 @@ class ScrcpyConfig(BaseModel):
     )
     tunnel_forward: bool = Field(default=True, description="Tunnel forward connections")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "max_size": 1920,
                 "bit_rate": 8000000,
@@ -54,7 +56,8 @@ class ScrcpyConfig(BaseModel):
                 "audio": True,
                 "tunnel_forward": True,
             }
-        }
+        },
+    )
 
 
 class ScrcpyServerState(str, Enum):
@@ -70,8 +73,19 @@ class ScrcpyServerState(str, Enum):
 class ScrcpyServerStatus(BaseModel):
     """SCRCpy server status"""
 
+    # The embedded config is frozen, so keep the caller's instance as-is
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     state: ScrcpyServerState = Field(..., description="Current server state")
     device_serial: str = Field(..., description="Device serial number")
     config: ScrcpyConfig = Field(..., description="Server configuration")
-    start_time: Optional[datetime] = Field(None, description="Start timestamp")
+    # Stored as epoch milliseconds; emitted as ISO 8601 by the serializer below
+    start_time: Optional[int] = Field(None, description="Start timestamp (ISO 8601)")
     error: Optional[str] = Field(None, description="Error message if state is error")
+
+    @field_serializer("start_time", when_used="json")
+    def serialize_start_time(self, start_time: Optional[int]) -> Optional[str]:
+        """Format the start time as ISO 8601 only when emitting JSON"""
+        if start_time is None:
+            return None
+        return datetime.fromtimestamp(start_time / 1000).isoformat()
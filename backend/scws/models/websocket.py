@@ -5,7 +5,9 @@ WebSocket message models
 from enum import Enum
 from typing import Any, Generic, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .device import Resolution
 
 
 class WSMessageType(str, Enum):
@@ -27,6 +29,8 @@ T = TypeVar("T")
 class WSMessage(BaseModel, Generic[T]):
     """Base WebSocket message"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     type: WSMessageType = Field(..., description="Message type")
     timestamp: int = Field(..., description="Timestamp in milliseconds")
     data: T = Field(..., description="Message payload")
@@ -35,6 +39,8 @@ class WSMessage(BaseModel, Generic[T]):
 class VideoFrameData(BaseModel):
     """Video frame data"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     sequence: int = Field(..., description="Frame sequence number")
     pts: int = Field(..., description="Presentation timestamp")
     is_keyframe: bool = Field(..., description="Is this a keyframe")
@@ -44,21 +50,18 @@ class VideoFrameData(BaseModel):
 class AudioFrameData(BaseModel):
     """Audio frame data"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     sequence: int = Field(..., description="Frame sequence number")
     pts: int = Field(..., description="Presentation timestamp")
     # Audio data is sent as binary, not in JSON
 
 
-class Resolution(BaseModel):
-    """Screen resolution"""
-
-    width: int
-    height: int
-
-
 class DeviceInfoData(BaseModel):
     """Device information"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     serial: str = Field(..., description="Device serial")
     model: str = Field(..., description="Device model")
     manufacturer: Optional[str] = Field(None, description="Device manufacturer")
@@ -71,6 +74,8 @@ class DeviceInfoData(BaseModel):
 class StreamStatusData(BaseModel):
     """Stream status information"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     serial: str = Field(..., description="Device serial")
     active: bool = Field(..., description="Is streaming active")
     client_count: int = Field(..., description="Number of connected clients")
@@ -82,6 +87,8 @@ class StreamStatusData(BaseModel):
 class ErrorMessageData(BaseModel):
     """Error message data"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     code: str = Field(..., description="Error code")
     message: str = Field(..., description="Error message")
     details: Optional[Any] = Field(None, description="Additional error details")
@@ -109,6 +116,8 @@ class ControlEventType(str, Enum):
 class TouchPosition(BaseModel):
     """Touch position coordinates"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     x: float = Field(..., ge=0.0, le=1.0, description="X coordinate (normalized 0-1)")
     y: float = Field(..., ge=0.0, le=1.0, description="Y coordinate (normalized 0-1)")
 
@@ -116,6 +125,8 @@ class TouchPosition(BaseModel):
 class ControlEvent(BaseModel):
     """Control event base"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     type: ControlEventType = Field(..., description="Event type")
     timestamp: int = Field(..., description="Event timestamp")
     position: Optional[TouchPosition] = Field(None, description="Touch position")
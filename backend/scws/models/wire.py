@@ -0,0 +1,134 @@
+"""
+Wire-format structs for high-frequency WebSocket messages
+
+Pydantic models remain the REST/schema boundary; these msgspec structs are
+used on the per-message control path where validation and decoding cost matter.
+"""
+
+from typing import Annotated, ClassVar, Optional, Union, cast
+
+import msgspec
+
+from .websocket import ControlEventType
+
+
+# Control events: one struct per event type, discriminated on "type"
+
+NormalizedCoordinate = Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]
+
+
+class TouchPosition(msgspec.Struct, frozen=True, gc=False):
+    """Touch position coordinates (normalized 0-1)"""
+
+    x: NormalizedCoordinate
+    y: NormalizedCoordinate
+
+
+class _ControlEvent(msgspec.Struct, tag_field="type", frozen=True, gc=False):
+    """Control event base"""
+
+    type: ClassVar[ControlEventType]
+
+    timestamp: int
+
+
+class _TouchEvent(_ControlEvent, frozen=True, gc=False):
+    position: TouchPosition
+    pointer_id: Optional[int] = None
+    pressure: Optional[float] = None
+
+
+class TouchDown(_TouchEvent, tag="touch_down", frozen=True, gc=False):
+    type = ControlEventType.TOUCH_DOWN
+
+
+class TouchUp(_TouchEvent, tag="touch_up", frozen=True, gc=False):
+    type = ControlEventType.TOUCH_UP
+
+
+class TouchMove(_TouchEvent, tag="touch_move", frozen=True, gc=False):
+    type = ControlEventType.TOUCH_MOVE
+
+
+class Scroll(_ControlEvent, tag="scroll", frozen=True, gc=False):
+    type = ControlEventType.SCROLL
+
+    position: TouchPosition
+    delta_x: float = 0.0
+    delta_y: float = 0.0
+
+
+class _KeyEvent(_ControlEvent, frozen=True, gc=False):
+    key_code: int
+    meta_state: Optional[int] = None
+
+
+class KeyDown(_KeyEvent, tag="key_down", frozen=True, gc=False):
+    type = ControlEventType.KEY_DOWN
+
+
+class KeyUp(_KeyEvent, tag="key_up", frozen=True, gc=False):
+    type = ControlEventType.KEY_UP
+
+
+class TextInput(_ControlEvent, tag="text_input", frozen=True, gc=False):
+    type = ControlEventType.TEXT_INPUT
+
+    text: str
+
+
+class Back(_ControlEvent, tag="back", frozen=True, gc=False):
+    type = ControlEventType.BACK
+
+
+class Home(_ControlEvent, tag="home", frozen=True, gc=False):
+    type = ControlEventType.HOME
+
+
+class AppSwitch(_ControlEvent, tag="app_switch", frozen=True, gc=False):
+    type = ControlEventType.APP_SWITCH
+
+
+class Power(_ControlEvent, tag="power", frozen=True, gc=False):
+    type = ControlEventType.POWER
+
+
+class VolumeUp(_ControlEvent, tag="volume_up", frozen=True, gc=False):
+    type = ControlEventType.VOLUME_UP
+
+
+class VolumeDown(_ControlEvent, tag="volume_down", frozen=True, gc=False):
+    type = ControlEventType.VOLUME_DOWN
+
+
+class Rotate(_ControlEvent, tag="rotate", frozen=True, gc=False):
+    type = ControlEventType.ROTATE
+
+    rotation: Optional[int] = None
+
+
+ControlEventUnion = Union[
+    TouchDown,
+    TouchUp,
+    TouchMove,
+    Scroll,
+    KeyDown,
+    KeyUp,
+    TextInput,
+    Back,
+    Home,
+    AppSwitch,
+    Power,
+    VolumeUp,
+    VolumeDown,
+    Rotate,
+]
+
+
+# Decoders are stateless and safe to share
+control_event_decoder = msgspec.json.Decoder(ControlEventUnion)
+
+
+def decode_control_event(raw: str | bytes) -> ControlEventUnion:
+    """Decode and validate a JSON control event"""
+    return cast(ControlEventUnion, control_event_decoder.decode(raw))
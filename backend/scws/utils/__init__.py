@@ -2,7 +2,8 @@
 Utility modules
 """
 
-from .logger import get_logger, logger, setup_logging
+from .logger import get_logger, logger, setup_logging, shutdown_logging
+from .clock import now_iso
 from .errors import (
     AppError,
     ADBConnectionError,
@@ -22,6 +23,8 @@ __all__ = [
     "logger",
     "get_logger",
     "setup_logging",
+    "shutdown_logging",
+    "now_iso",
     "AppError",
     "ADBConnectionError",
     "ADBDeviceNotFoundError",
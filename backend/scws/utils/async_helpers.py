@@ -14,6 +14,7 @@ async def retry_with_backoff(
     initial_delay: float = 1.0,
     max_delay: float = 60.0,
     backoff_factor: float = 2.0,
+    retry_on: tuple[type[Exception], ...] = (Exception,),
 ) -> T:
     """
     Retry an async function with exponential backoff
@@ -24,6 +25,7 @@ async def retry_with_backoff(
         initial_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
         backoff_factor: Backoff multiplication factor
+        retry_on: Exception types that trigger a retry; others propagate immediately
 
     Returns:
         Result from successful function call
@@ -31,19 +33,23 @@ async def retry_with_backoff(
     Raises:
         Last exception if all attempts fail
     """
+    # Delay before each retry, computed once up front
+    delays = tuple(
+        min(initial_delay * backoff_factor**i, max_delay) for i in range(max_attempts - 1)
+    )
+
     last_exception: Exception | None = None
 
-    for attempt in range(1, max_attempts + 1):
+    for attempt in range(max_attempts):
         try:
             return await func()
-        except Exception as e:
+        except retry_on as e:
             last_exception = e
 
-            if attempt == max_attempts:
+            if attempt == max_attempts - 1:
                 break
 
-            delay = min(initial_delay * (backoff_factor ** (attempt - 1)), max_delay)
-            await asyncio.sleep(delay)
+            await asyncio.sleep(delays[attempt])
 
     if last_exception:
         raise last_exception
@@ -54,6 +60,9 @@ async def with_timeout(coro: Awaitable[T], timeout: float) -> T:
     """
     Execute a coroutine with a timeout
 
+    The coroutine is awaited inline in the current task under an
+    asyncio.timeout() scope rather than being wrapped in a new task.
+
     Args:
         coro: Coroutine to execute
         timeout: Timeout in seconds
@@ -64,4 +73,5 @@ async def with_timeout(coro: Awaitable[T], timeout: float) -> T:
     Raises:
         asyncio.TimeoutError: If timeout is exceeded
     """
-    return await asyncio.wait_for(coro, timeout=timeout)
+    async with asyncio.timeout(timeout):
+        return await coro
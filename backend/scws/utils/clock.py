@@ -0,0 +1,18 @@
+"""
+Shared wall-clock timestamps for API responses
+"""
+
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _format_second(second: int) -> str:
+    """Format an epoch second as an ISO 8601 UTC timestamp"""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
+def now_iso() -> str:
+    """Get the current ISO timestamp, formatted at most once per second"""
+    return _format_second(int(time.time()))
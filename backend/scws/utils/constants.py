@@ -2,39 +2,56 @@
 Application constants
 """
 
-# Android key codes (subset of commonly used keys)
-ANDROID_KEY_CODES = {
-    "KEYCODE_HOME": 3,
-    "KEYCODE_BACK": 4,
-    "KEYCODE_MENU": 82,
-    "KEYCODE_POWER": 26,
-    "KEYCODE_VOLUME_UP": 24,
-    "KEYCODE_VOLUME_DOWN": 25,
-    "KEYCODE_ENTER": 66,
-    "KEYCODE_DEL": 67,
-    "KEYCODE_SPACE": 62,
-}
+from enum import IntEnum
+from types import MappingProxyType
+
+
+class KeyName(IntEnum):
+    """Index into KEYCODES for commonly used Android keys"""
+
+    HOME = 0
+    BACK = 1
+    MENU = 2
+    POWER = 3
+    VOLUME_UP = 4
+    VOLUME_DOWN = 5
+    ENTER = 6
+    DEL = 7
+    SPACE = 8
+
+
+# Android key codes, indexed by KeyName (e.g. KEYCODES[KeyName.HOME])
+KEYCODES: tuple[int, ...] = (3, 4, 82, 26, 24, 25, 66, 67, 62)
+
+# Android key codes by name (subset of commonly used keys)
+ANDROID_KEY_CODES = MappingProxyType({f"KEYCODE_{key.name}": KEYCODES[key] for key in KeyName})
 
 # Performance targets
-PERFORMANCE_TARGETS = {
-    "TARGET_VIDEO_LATENCY_MS": 50,
-    "MAX_VIDEO_LATENCY_MS": 100,
-    "TARGET_CONTROL_LATENCY_MS": 20,
-    "MAX_CONTROL_LATENCY_MS": 30,
-    "MIN_FPS": 30,
-    "TARGET_FPS": 60,
-}
+PERFORMANCE_TARGETS = MappingProxyType(
+    {
+        "TARGET_VIDEO_LATENCY_MS": 50,
+        "MAX_VIDEO_LATENCY_MS": 100,
+        "TARGET_CONTROL_LATENCY_MS": 20,
+        "MAX_CONTROL_LATENCY_MS": 30,
+        "MIN_FPS": 30,
+        "TARGET_FPS": 60,
+    }
+)
 
 # Timeouts
-TIMEOUTS = {
-    "ADB_CONNECTION_TIMEOUT": 30,  # seconds
-    "SCRCPY_START_TIMEOUT": 10,  # seconds
-    "WEBSOCKET_PING_TIMEOUT": 30,  # seconds
-}
+TIMEOUTS = MappingProxyType(
+    {
+        "ADB_CONNECTION_TIMEOUT": 30,  # seconds
+        "SCRCPY_START_TIMEOUT": 10,  # seconds
+        "WEBSOCKET_PING_TIMEOUT": 30,  # seconds
+    }
+)
 
 # Limits
-LIMITS = {
-    "MAX_CONCURRENT_STREAMS": 10,
-    "MAX_CLIENTS_PER_DEVICE": 5,
-    "MAX_FRAME_BUFFER_SIZE": 100,
-}
+LIMITS = MappingProxyType(
+    {
+        "MAX_CONCURRENT_STREAMS": 10,
+        "MAX_CLIENTS_PER_DEVICE": 5,
+        "MAX_FRAME_BUFFER_SIZE": 100,
+    }
+)
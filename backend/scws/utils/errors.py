@@ -2,7 +2,8 @@
 Custom exception classes
 """
 
-from typing import Any, Optional
+import sys
+from typing import Any, ClassVar, Mapping, Optional
 
 
 class AppError(Exception):
@@ -20,14 +21,33 @@ class AppError(Exception):
         self.message = message
         self.status_code = status_code
         self.details = details
+        self._dict_cache: Optional[dict[str, Any]] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert error to dictionary"""
-        return {
-            "code": self.code,
-            "message": self.message,
-            "details": self.details,
-        }
+    def to_dict(self) -> Mapping[str, Any]:
+        """Convert error to a read-only dictionary"""
+        # Built once per error and shared between callers, so it must not be mutated
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "code": self.code,
+                "message": self.message,
+                "details": self.details,
+            }
+        return self._dict_cache
+
+
+class _SerialError(AppError):
+    """Error about one device, built from class-level code/message/status"""
+
+    _CODE: ClassVar[str]
+    _TEMPLATE: ClassVar[str]
+    _STATUS: ClassVar[int]
+
+    def __init__(self, serial: str) -> None:
+        # Serials are short identifiers raised repeatedly for the same device
+        serial = sys.intern(serial)
+        super().__init__(
+            self._CODE, self._TEMPLATE.format(serial), self._STATUS, {"serial": serial}
+        )
 
 
 # ADB Errors
@@ -38,40 +58,28 @@ class ADBConnectionError(AppError):
         super().__init__("ADB_CONNECTION_FAILED", message, 503, details)
 
 
-class ADBDeviceNotFoundError(AppError):
+class ADBDeviceNotFoundError(_SerialError):
     """ADB device not found error"""
 
-    def __init__(self, serial: str) -> None:
-        super().__init__(
-            "ADB_DEVICE_NOT_FOUND",
-            f"Device not found: {serial}",
-            404,
-            {"serial": serial},
-        )
+    _CODE = "ADB_DEVICE_NOT_FOUND"
+    _TEMPLATE = "Device not found: {}"
+    _STATUS = 404
 
 
-class ADBDeviceUnauthorizedError(AppError):
+class ADBDeviceUnauthorizedError(_SerialError):
     """ADB device unauthorized error"""
 
-    def __init__(self, serial: str) -> None:
-        super().__init__(
-            "ADB_DEVICE_UNAUTHORIZED",
-            f"Device unauthorized: {serial}. Please authorize on device.",
-            403,
-            {"serial": serial},
-        )
+    _CODE = "ADB_DEVICE_UNAUTHORIZED"
+    _TEMPLATE = "Device unauthorized: {}. Please authorize on device."
+    _STATUS = 403
 
 
-class ADBDeviceOfflineError(AppError):
+class ADBDeviceOfflineError(_SerialError):
     """ADB device offline error"""
 
-    def __init__(self, serial: str) -> None:
-        super().__init__(
-            "ADB_DEVICE_OFFLINE",
-            f"Device offline: {serial}",
-            503,
-            {"serial": serial},
-        )
+    _CODE = "ADB_DEVICE_OFFLINE"
+    _TEMPLATE = "Device offline: {}"
+    _STATUS = 503
 
 
 # SCRCpy Errors
@@ -97,28 +105,20 @@ class ScrcpyServerCrashError(AppError):
 
 
 # Streaming Errors
-class StreamNotFoundError(AppError):
+class StreamNotFoundError(_SerialError):
     """Stream not found error"""
 
-    def __init__(self, serial: str) -> None:
-        super().__init__(
-            "STREAM_NOT_FOUND",
-            f"Stream not found for device: {serial}",
-            404,
-            {"serial": serial},
-        )
+    _CODE = "STREAM_NOT_FOUND"
+    _TEMPLATE = "Stream not found for device: {}"
+    _STATUS = 404
 
 
-class StreamAlreadyActiveError(AppError):
+class StreamAlreadyActiveError(_SerialError):
     """Stream already active error"""
 
-    def __init__(self, serial: str) -> None:
-        super().__init__(
-            "STREAM_ALREADY_ACTIVE",
-            f"Stream already active for device: {serial}",
-            409,
-            {"serial": serial},
-        )
+    _CODE = "STREAM_ALREADY_ACTIVE"
+    _TEMPLATE = "Stream already active for device: {}"
+    _STATUS = 409
 
 
 # Generic Errors
@@ -132,5 +132,7 @@ class ValidationError(AppError):
 class NotFoundError(AppError):
     """Not found error"""
 
+    _TEMPLATE: ClassVar[str] = "{} not found"
+
     def __init__(self, resource: str) -> None:
-        super().__init__("NOT_FOUND", f"{resource} not found", 404)
+        super().__init__("NOT_FOUND", self._TEMPLATE.format(resource), 404)
@@ -3,32 +3,58 @@ Structured logging with structlog
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Any
+from typing import Any, Callable, Optional, cast
 
+import orjson
 import structlog
-from structlog.types import EventDict, WrappedLogger
 
 from scws.config import settings
 
+# Service name bound into every logger's initial context
+SERVICE_NAME = "scws-api"
 
-def add_app_context(
-    logger: WrappedLogger, method_name: str, event_dict: EventDict
-) -> EventDict:
-    """Add application context to log entries"""
-    event_dict["service"] = "scws-api"
-    return event_dict
+# Background thread that owns the real stdout handler
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _orjson_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer"""
+    return orjson.dumps(
+        obj, default=default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    ).decode()
+
+
+def _stdout_handler() -> logging.Handler:
+    """Create the handler that writes rendered records to stdout"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
 
 
 def setup_logging() -> None:
     """Configure structured logging"""
 
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.log_level),
+    global _queue_listener
+
+    # Configure standard logging. Records are handed to a queue and written to
+    # stdout from a listener thread, keeping blocking writes off the event loop.
+    shutdown_logging()
+
+    stream_handler = _stdout_handler()
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
     )
+    _queue_listener.start()
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    min_level = getattr(logging, settings.log_level)
+    root_logger.setLevel(min_level)
 
     # Shared processors
     shared_processors: list[structlog.types.Processor] = [
@@ -36,7 +62,6 @@ def setup_logging() -> None:
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        add_app_context,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
     ]
@@ -45,7 +70,7 @@ def setup_logging() -> None:
     if settings.log_format == "json":
         processors = shared_processors + [
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ]
     else:
         processors = shared_processors + [
@@ -55,17 +80,35 @@ def setup_logging() -> None:
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the configured level are no-ops before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(min_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the listener thread"""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+        # With no listener the QueueHandler would drop records; write directly
+        logging.getLogger().handlers = [_stdout_handler()]
+
+
 # Global logger instance
-logger: structlog.stdlib.BoundLogger = structlog.get_logger()
+logger = cast(structlog.typing.FilteringBoundLogger, structlog.get_logger(service=SERVICE_NAME))
 
 
-def get_logger(name: str, **context: Any) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str, **context: Any) -> structlog.typing.FilteringBoundLogger:
     """Get a logger with additional context"""
-    return logger.bind(module=name, **context)
+    # Stay lazy: binding now would freeze the logger before setup_logging runs,
+    # bypassing the configured processors and the stdlib handler chain
+    return cast(
+        structlog.typing.FilteringBoundLogger,
+        structlog.get_logger(name, service=SERVICE_NAME, module=name, **context),
+    )
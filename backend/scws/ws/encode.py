@@ -0,0 +1,15 @@
+"""
+WebSocket message encoding
+"""
+
+from functools import partial
+
+import orjson
+from pydantic import BaseModel
+
+dumps = partial(orjson.dumps, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
+def encode_message(message: BaseModel) -> str:
+    """Encode a Pydantic message as a JSON text frame"""
+    return dumps(message.model_dump()).decode()
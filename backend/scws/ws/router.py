@@ -3,160 +3,311 @@ WebSocket router and handlers
 """
 
 import asyncio
-from datetime import datetime
-from typing import Dict, Set
+import logging
+import os
+import time
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 from fastapi.websockets import WebSocketState
 
+from scws.config import settings
 from scws.models import (
-    ControlEvent,
+    ADBDevice,
     DeviceInfoData,
-    ErrorMessageData,
     Resolution,
     WSMessage,
-    WSMessageType,
 )
+from scws.models.wire import decode_control_event
 from scws.utils import get_logger
 
+from .encode import dumps, encode_message
+
 logger = get_logger(__name__)
 
+# Underlying stdlib logger, used to skip per-message debug calls cheaply
+_stdlib_logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
-# Track active WebSocket connections per device
-active_connections: Dict[str, Set[WebSocket]] = {}
+# Control acknowledgements; the payload shape is fixed, so skip the JSON encoder
+_ACK_OK = '{"status":"ok"}'
+_ACK_ERROR = '{{"status":"error","message":{message}}}'
+
+# Stream error message (WSMessage[ErrorMessageData]) with only the variable parts open
+_ERROR_TEMPLATE = (
+    '{{"type":"error","timestamp":{timestamp},'
+    '"data":{{"code":"WEBSOCKET_ERROR","message":{message},"details":null}}}}'
+)
+
+# Number of connection registry shards; a power of two so a mask picks the shard
+WS_SHARD_COUNT = 1 << (4 * (os.cpu_count() or 1) - 1).bit_length()
+
+
+class WSClient:
+    """Connected WebSocket client with a bounded outbound queue"""
+
+    __slots__ = ("websocket", "queue", "writer")
+
+    def __init__(self, websocket: WebSocket, maxsize: int) -> None:
+        self.websocket = websocket
+        self.queue: asyncio.Queue[Union[str, bytes]] = asyncio.Queue(maxsize)
+        self.writer: Optional[asyncio.Task[None]] = None
 
 
 class ConnectionManager:
     """Manage WebSocket connections"""
 
     def __init__(self) -> None:
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # Clients per device serial (single source of truth), sharded so each
+        # update touches only a small map. No registry update awaits between
+        # reading and writing a shard, so none needs a lock on the event loop.
+        self._shards: List[Dict[str, Dict[WebSocket, WSClient]]] = [
+            {} for _ in range(WS_SHARD_COUNT)
+        ]
+        # Background closes of evicted clients, referenced until they finish
+        self._closing: Set[asyncio.Task[None]] = set()
+
+    def _shard(self, serial: str) -> Dict[str, Dict[WebSocket, WSClient]]:
+        """Get the client map owning a device serial"""
+        return self._shards[hash(serial) & (WS_SHARD_COUNT - 1)]
 
     async def connect(self, websocket: WebSocket, serial: str) -> None:
         """Connect a new WebSocket client"""
         await websocket.accept()
 
-        if serial not in self.active_connections:
-            self.active_connections[serial] = set()
+        client = WSClient(websocket, settings.ws_outbound_buffer)
+        client.writer = asyncio.create_task(self._write_loop(client, serial))
 
-        self.active_connections[serial].add(websocket)
+        clients = self._shard(serial).setdefault(serial, {})
+        clients[websocket] = client
 
         logger.info(
             "WebSocket client connected",
             serial=serial,
-            client_count=len(self.active_connections[serial]),
+            client_count=len(clients),
         )
 
     async def disconnect(self, websocket: WebSocket, serial: str) -> None:
         """Disconnect a WebSocket client"""
-        if serial in self.active_connections:
-            self.active_connections[serial].discard(websocket)
+        connections = self._shard(serial)
+        clients = connections.get(serial)
+        if clients is None:
+            return
 
-            if not self.active_connections[serial]:
-                del self.active_connections[serial]
+        client = clients.pop(websocket, None)
+        if not clients:
+            del connections[serial]
 
-            logger.info(
-                "WebSocket client disconnected",
-                serial=serial,
-                remaining_clients=len(self.active_connections.get(serial, [])),
-            )
+        # Stop the writer unless it is the one reporting its own failure
+        writer = client.writer if client is not None else None
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+        logger.info(
+            "WebSocket client disconnected",
+            serial=serial,
+            remaining_clients=len(clients),
+        )
 
     async def send_message(self, message: WSMessage[object], serial: str) -> None:
         """Send message to all clients for a device"""
-        if serial not in self.active_connections:
+        clients = self._snapshot(serial)
+        if not clients:
             return
 
-        disconnected: Set[WebSocket] = set()
+        # Encode once and share the same string with every client
+        await self._broadcast(serial, clients, encode_message(message))
 
-        for websocket in self.active_connections[serial]:
+    async def send_binary(self, data: bytes, serial: str) -> None:
+        """Send binary data to all clients for a device"""
+        clients = self._snapshot(serial)
+        if not clients:
+            return
+
+        await self._broadcast(serial, clients, data)
+
+    def _snapshot(self, serial: str) -> Tuple[WSClient, ...]:
+        """Get an immutable copy of a device's clients"""
+        # No await between lookup and copy, so this is atomic on the event loop
+        clients = self._shard(serial).get(serial)
+        return tuple(clients.values()) if clients else ()
+
+    async def _broadcast(
+        self, serial: str, clients: Tuple[WSClient, ...], data: Union[str, bytes]
+    ) -> None:
+        """Queue data for a snapshot of clients, dropping clients that fall behind"""
+        # Enqueueing never waits on a client, so one slow viewer cannot stall
+        # the producer; a client whose queue is full is evicted instead
+        disconnected: List[WebSocket] = []
+        overflowed: List[WebSocket] = []
+        for client in clients:
+            websocket = client.websocket
+            if websocket.client_state != WebSocketState.CONNECTED:
+                disconnected.append(websocket)
+                continue
             try:
-                if websocket.client_state == WebSocketState.CONNECTED:
-                    await websocket.send_json(message.model_dump())
-                else:
-                    disconnected.add(websocket)
-            except Exception as e:
-                logger.error("Error sending message to client", error=str(e))
-                disconnected.add(websocket)
+                client.queue.put_nowait(data)
+            except asyncio.QueueFull:
+                overflowed.append(websocket)
 
         # Remove disconnected clients
-        for websocket in disconnected:
-            await self.disconnect(websocket, serial)
+        if disconnected or overflowed:
+            await self._prune(serial, disconnected + overflowed)
 
-    async def send_binary(self, data: bytes, serial: str) -> None:
-        """Send binary data to all clients for a device"""
-        if serial not in self.active_connections:
+        if overflowed:
+            logger.warning(
+                "WebSocket clients too slow, disconnecting",
+                serial=serial,
+                count=len(overflowed),
+            )
+            # A stalled client may never complete the close handshake, so the
+            # broadcast must not wait for it
+            for websocket in overflowed:
+                task = asyncio.create_task(self._close(websocket))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket) -> None:
+        """Close an evicted client's WebSocket, ignoring transport errors"""
+        try:
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        except Exception:
+            pass
+
+    async def _prune(self, serial: str, websockets: List[WebSocket]) -> None:
+        """Remove several clients of a device in one registry update"""
+        connections = self._shard(serial)
+        clients = connections.get(serial)
+        if clients is None:
             return
 
-        disconnected: Set[WebSocket] = set()
+        removed: List[WSClient] = []
+        for websocket in websockets:
+            client = clients.pop(websocket, None)
+            if client is not None:
+                removed.append(client)
+        if not clients:
+            del connections[serial]
 
-        for websocket in self.active_connections[serial]:
-            try:
-                if websocket.client_state == WebSocketState.CONNECTED:
+        if not removed:
+            return
+
+        for client in removed:
+            if client.writer is not None:
+                client.writer.cancel()
+
+        logger.info(
+            "Pruned WebSocket clients",
+            serial=serial,
+            pruned=len(removed),
+            remaining_clients=len(clients),
+        )
+
+    async def _write_loop(self, client: WSClient, serial: str) -> None:
+        """Drain a client's outbound queue onto its WebSocket"""
+        websocket = client.websocket
+        queue = client.queue
+        try:
+            while True:
+                data = await queue.get()
+                if isinstance(data, bytes):
                     await websocket.send_bytes(data)
                 else:
-                    disconnected.add(websocket)
-            except Exception as e:
-                logger.error("Error sending binary to client", error=str(e))
-                disconnected.add(websocket)
-
-        # Remove disconnected clients
-        for websocket in disconnected:
+                    await websocket.send_text(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Error sending to client", serial=serial, error=str(e))
             await self.disconnect(websocket, serial)
 
 
 manager = ConnectionManager()
 
+# Device info message with the per-device payload spliced in pre-encoded
+_DEVICE_INFO_TEMPLATE = '{{"type":"device_info","timestamp":{timestamp},"data":{data}}}'
 
-@router.websocket("/stream/{serial}")
-async def websocket_stream(websocket: WebSocket, serial: str) -> None:
-    """WebSocket endpoint for video/audio streaming"""
-    await manager.connect(websocket, serial)
 
-    try:
-        # Send device info
+# Reported until the device manager knows the device's real screen size
+_DEFAULT_RESOLUTION = Resolution(width=1080, height=1920)
+
+
+@lru_cache(maxsize=256)
+def _device_info_json(serial: str, device: Optional[ADBDevice]) -> str:
+    """Encode the device info payload once per serial and device snapshot"""
+    # ADBDevice is frozen, so a reconnect (new snapshot) misses the cache
+    if device is None:
         device_info = DeviceInfoData(
             serial=serial,
-            model="Test Device",  # TODO: Get from device manager
-            resolution=Resolution(width=1080, height=1920),
+            model="Unknown device",
+            manufacturer=None,
+            android_version=None,
+            resolution=_DEFAULT_RESOLUTION,
             video_codec="h264",
             audio_codec="opus",
         )
-
-        device_info_msg: WSMessage[DeviceInfoData] = WSMessage(
-            type=WSMessageType.DEVICE_INFO,
-            timestamp=int(datetime.now().timestamp() * 1000),
-            data=device_info,
+    else:
+        device_info = DeviceInfoData(
+            serial=serial,
+            model=device.model,
+            manufacturer=device.manufacturer,
+            android_version=device.android_version,
+            resolution=device.resolution or _DEFAULT_RESOLUTION,
+            video_codec="h264",
+            audio_codec="opus",
         )
+    return encode_message(device_info)
 
-        await websocket.send_json(device_info_msg.model_dump())
 
-        # Handle incoming messages
-        while True:
-            try:
-                # Receive message from client
-                message = await websocket.receive_text()
+async def _iter_frames(websocket: WebSocket) -> AsyncIterator[Union[str, bytes]]:
+    """Yield text or binary frames until the client disconnects"""
+    # Like WebSocket.iter_text/iter_bytes, but accepts either frame type so
+    # binary payloads are passed on without a UTF-8 round-trip
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        text = message.get("text")
+        yield text if text is not None else message.get("bytes") or b""
+
 
+@router.websocket("/stream/{serial}")
+async def websocket_stream(websocket: WebSocket, serial: str) -> None:
+    """WebSocket endpoint for video/audio streaming"""
+    await manager.connect(websocket, serial)
+    debug = _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+    try:
+        # Send device info
+        device = websocket.app.state.device_manager.get_device(serial)
+        await websocket.send_text(
+            _DEVICE_INFO_TEMPLATE.format(
+                timestamp=time.time_ns() // 1_000_000, data=_device_info_json(serial, device)
+            )
+        )
+
+        # Handle incoming messages until the client disconnects
+        try:
+            async for message in websocket.iter_text():
                 # Parse message (would contain control events in production)
-                logger.debug("Received message from client", serial=serial, message=message)
+                if debug:
+                    logger.debug("Received message from client", serial=serial, message=message)
 
                 # Echo back for testing
                 await websocket.send_text(message)
 
-            except WebSocketDisconnect:
-                break
-            except Exception as e:
-                logger.error("Error in WebSocket loop", error=str(e))
-                error_msg: WSMessage[ErrorMessageData] = WSMessage(
-                    type=WSMessageType.ERROR,
-                    timestamp=int(datetime.now().timestamp() * 1000),
-                    data=ErrorMessageData(
-                        code="WEBSOCKET_ERROR",
-                        message=str(e),
-                    ),
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            logger.error("Error in WebSocket loop", error=str(e))
+            await websocket.send_text(
+                _ERROR_TEMPLATE.format(
+                    timestamp=time.time_ns() // 1_000_000,
+                    message=dumps(str(e)).decode(),
                 )
-                await websocket.send_json(error_msg.model_dump())
-                break
+            )
 
     finally:
         await manager.disconnect(websocket, serial)
@@ -166,32 +317,33 @@ async def websocket_stream(websocket: WebSocket, serial: str) -> None:
 async def websocket_control(websocket: WebSocket, serial: str) -> None:
     """WebSocket endpoint for control events"""
     await manager.connect(websocket, serial)
+    debug = _stdlib_logger.isEnabledFor(logging.DEBUG)
 
     try:
-        while True:
+        async for data in _iter_frames(websocket):
             try:
-                # Receive control event from client
-                data = await websocket.receive_json()
+                # Parse and validate in one pass, dispatching on the "type" tag
+                control_event = decode_control_event(data)
 
-                # Parse control event
-                control_event = ControlEvent(**data)
-
-                logger.debug(
-                    "Received control event",
-                    serial=serial,
-                    event_type=control_event.type.value,
-                )
+                if debug:
+                    logger.debug(
+                        "Received control event",
+                        serial=serial,
+                        event_type=control_event.type.value,
+                    )
 
                 # TODO: Process control event and send to device
 
                 # Acknowledge
-                await websocket.send_json({"status": "ok"})
+                await websocket.send_text(_ACK_OK)
 
             except WebSocketDisconnect:
-                break
+                raise
             except Exception as e:
                 logger.error("Error processing control event", error=str(e))
-                await websocket.send_json({"status": "error", "message": str(e)})
+                await websocket.send_text(_ACK_ERROR.format(message=dumps(str(e)).decode()))
 
+    except WebSocketDisconnect:
+        pass
     finally:
         await manager.disconnect(websocket, serial)
@@ -0,0 +1,51 @@
+"""
+Application lifespan tests
+"""
+
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+from scws.main import app
+
+# The package re-exports the singleton under the submodule's name
+device_manager = sys.modules["scws.core.adb.device_manager"].device_manager
+HEALTH_CHECK_INTERVAL = sys.modules["scws.core.adb.device_manager"].HEALTH_CHECK_INTERVAL
+
+
+class FakeConnection:
+    """Connection stub that always passes its health check"""
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def disconnect(self) -> None:
+        pass
+
+
+def _add_due_device(serial: str) -> None:
+    """Register a connection whose health check is already due"""
+    device_manager._connections[serial] = FakeConnection()
+    device_manager._publish_snapshot()
+    device_manager._schedule_check(serial, time.monotonic() - HEALTH_CHECK_INTERVAL)
+
+
+def _wait_for_check(serial: str, timeout: float = 2.0) -> None:
+    """Wait until the polling loop has run the pending health check"""
+    deadline = time.monotonic() + timeout
+    while device_manager._next_check.get(serial, 0.0) <= time.monotonic():
+        assert time.monotonic() < deadline, "health check did not run"
+        time.sleep(0.01)
+
+
+def test_lifespan_can_run_twice() -> None:
+    """The device manager polls health checks on every new event loop"""
+    for _ in range(2):
+        with TestClient(app) as client:
+            client.portal.call(_add_due_device, "fake-device")
+            _wait_for_check("fake-device")
+
+            response = client.get("/api/health")
+            assert response.status_code == 200
+            assert response.json()["status"] == "healthy"